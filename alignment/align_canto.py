@@ -5,50 +5,91 @@ Implements the variable-length block alignment algorithm from PLAN.md.
 Simple version without gap detection.
 """
 
+import io
 import re
 import sys
-import json
+import time
+import asyncio
+from contextvars import ContextVar
 from pathlib import Path
-from typing import List, Tuple, Literal
+from typing import Iterator, List, Tuple, Literal
 from pydantic import BaseModel, Field
 
+# Parse LLM responses with orjson if it is installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Add parent directory to path to import dante_norton
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dante_norton import Canto, LLMClient
 
 
-# Structured output schemas
-class ExtractionResult(BaseModel):
-    """LLM extraction result for Norton English text."""
+# Structured output schema
+class ExtractAndValidate(BaseModel):
+    """LLM result combining translation, extraction and self-validation."""
+    modern_translation: str = Field(
+        description="Simple, modern English paraphrase of the Italian text"
+    )
     extracted_text: str = Field(
         description="The extracted Norton English text, without any quotation marks or formatting"
     )
+    reason: str = Field(
+        description="Short justification for the YES/NO answer"
+    )
+    answer: Literal["YES", "NO"]
 
 
-class ValidationResult(BaseModel):
-    """LLM validation result."""
-    answer: Literal["YES", "NO"]
+class BatchExtraction(BaseModel):
+    """LLM results for several consecutive Italian lines, one item per line."""
+    items: List[ExtractAndValidate]
+
 
+# Annotation marker in Norton text, e.g. "[12]"
+_ANNO_MARKER = re.compile(r'\[\d+\]')
+
+# Spaces and punctuation skipped between matched blocks
+_PUNCT_WS = " ,;.!?"
 
 # Global log file handle
 _log_file = None
 
+# Time of the last log flush (flushed at most once per second)
+_last_flush = 0.0
+
+# Per-task log buffer, so that concurrently aligned paragraphs do not interleave
+_log_buffer: ContextVar[io.StringIO | None] = ContextVar('_log_buffer', default=None)
+
 
 def log_print(*args, **kwargs):
     """Print to log file only"""
-    if _log_file:
+    if (buffer := _log_buffer.get()) is not None:
+        print(*args, **kwargs, file=buffer)
+    elif _log_file:
         print(*args, **kwargs, file=_log_file)
+        flush_log(force=False)
+
+
+def flush_log(force: bool = True):
+    """Flush the log file, or only if a second has passed since the last flush"""
+    global _last_flush
+    now = time.monotonic()
+    if _log_file and (force or now - _last_flush > 1.0):
         _log_file.flush()
+        _last_flush = now
 
 
 class ItalianLine:
     """Represents a single line from tokenize/inferno/*.txt"""
 
+    __slots__ = ('full_text', 'tokens', 'line_num')
+
     def __init__(self, line_text: str):
-        parts = line_text.split('|')
-        self.full_text = parts[0]
-        self.tokens = parts[1:] if len(parts) > 1 else []
+        full_text, sep, tokens = line_text.partition('|')
+        self.full_text = full_text
+        self.tokens = tokens.split('|') if sep else []
         self.line_num = 0  # Will be set later
 
     def __repr__(self):
@@ -67,17 +108,20 @@ class AlignmentBlock:
         return f"AlignmentBlock({len(self.italian_lines)} lines)"
 
 
-def load_italian_lines(filepath: str) -> List[ItalianLine]:
-    """Load Italian lines from tokenize/inferno/*.txt file"""
-    lines = []
+def iter_italian_lines(filepath: str) -> Iterator[ItalianLine]:
+    """Iterate over Italian lines from tokenize/inferno/*.txt file"""
     with open(filepath, 'r', encoding='utf-8') as f:
         for line_num, line in enumerate(f, 1):
             line = line.strip()
             if line:
                 italian_line = ItalianLine(line)
                 italian_line.line_num = line_num
-                lines.append(italian_line)
-    return lines
+                yield italian_line
+
+
+def load_italian_lines(filepath: str) -> List[ItalianLine]:
+    """Load Italian lines from tokenize/inferno/*.txt file"""
+    return list(iter_italian_lines(filepath))
 
 
 def is_block_complete(norton_text: str, matched_words: List[str]) -> bool:
@@ -90,10 +134,18 @@ def is_block_complete(norton_text: str, matched_words: List[str]) -> bool:
     Returns:
         True if no islands detected (block is complete)
     """
-    # Replace matched words with "#"
-    test_text = norton_text
+    # Replace matched words with "#", scanning forward from the previous match
+    pieces = []
+    cursor = 0
     for word in matched_words:
-        test_text = test_text.replace(word, "#" * len(word), 1)
+        idx = norton_text.find(word, cursor)
+        if idx < 0:
+            continue
+        pieces.append(norton_text[cursor:idx])
+        pieces.append("#" * len(word))
+        cursor = idx + len(word)
+    pieces.append(norton_text[cursor:])
+    test_text = ''.join(pieces)
 
     # Log the replaced text
     log_print(f"    Replaced: {test_text[:100]}{'...' if len(test_text) > 100 else ''}")
@@ -107,7 +159,7 @@ def is_block_complete(norton_text: str, matched_words: List[str]) -> bool:
         return True
 
     # Check if "#" appears after first alphabetic character (= island)
-    has_island = '#' in test_text[first_alpha_idx:]
+    has_island = test_text.find('#', first_alpha_idx) >= 0
 
     log_print(f"    Island: {has_island}")
 
@@ -115,230 +167,271 @@ def is_block_complete(norton_text: str, matched_words: List[str]) -> bool:
     return not has_island
 
 
-def query_word_correspondences(llm: LLMClient, italian_block: List[ItalianLine],
-                               norton_text: str, skip_translation: bool = False) -> Tuple[str, List[str]] | None:
+def check_extraction(data: dict, italian_block: List[ItalianLine],
+                     norton_text: str, skip_translation: bool = False,
+                     norton_lower: str | None = None) -> str | None:
     """
-    Query LLM to extract English text corresponding to Italian block.
-    Uses two-stage approach: translate Italian first, then match in Norton text.
+    Post-process one extraction result and apply the validation constraints.
 
     Args:
-        skip_translation: If True, use Italian text directly as reference instead of translating
+        data: Parsed ExtractAndValidate result
+        italian_block: Italian lines the extraction belongs to
+        norton_text: Norton text the extraction must start
+        skip_translation: If True, no modern translation was requested
+        norton_lower: norton_text.lower(), if already computed by the caller
 
     Returns:
-        Tuple of (extracted text, word list) or None if extraction failed
+        Extracted text, or None if the extraction was rejected
     """
     italian_text = '\n'.join(line.full_text for line in italian_block)
-    num_italian_lines = len(italian_block)
+    if norton_lower is None:
+        norton_lower = norton_text.lower()
+    answer = data["answer"]
+
+    if not skip_translation:
+        log_print(f"    Modern translation: {data['modern_translation']}")
+
+    # Strip quotes only if text is fully enclosed in matching quotes
+    extracted = data["extracted_text"].strip()
+    if (extracted.startswith('"') and extracted.endswith('"')) or \
+       (extracted.startswith("'") and extracted.endswith("'")):
+        extracted = extracted[1:-1]
+
+    # Restore punctuation from original Norton text if missing
+    # Find the position of extracted text in norton_text
+    extracted_lower = extracted.lower()
+    idx = norton_lower.find(extracted_lower)
+    if idx != -1:
+        end_pos = idx + len(extracted)
+        # Check if there's punctuation immediately after in the original
+        if end_pos < len(norton_text):
+            next_char = norton_text[end_pos]
+            if next_char in ',.;:!?' and not extracted.endswith(next_char):
+                # Add the punctuation if missing
+                extracted = extracted + next_char
+                extracted_lower = extracted_lower + next_char
+
+    log_print(f"    Extracted: {extracted[:100]}{'...' if len(extracted) > 100 else ''}")
+    log_print(f"    LLM validation: {answer} ({data['reason']})")
+
+    if answer == "NO":
+        log_print(f"      Validation failed")
+        return None
 
-    if skip_translation:
-        # Use Italian text directly as reference
-        reference_text = italian_text
-        log_print(f"    Using Italian directly: {reference_text}")
-    else:
-        # Stage 1: Translate Italian to modern English
-        # For single lines, translate just that line
-        # For multiple lines (enjambment), translate all lines together
-        if num_italian_lines == 1:
-            text_to_translate = italian_block[0].full_text
-        else:
-            text_to_translate = italian_text
+    # Length ratio check (hard constraint)
+    italian_word_count = len(italian_text.split())
+    extracted_word_count = len(extracted.split())
+    ratio = extracted_word_count / italian_word_count if italian_word_count > 0 else 0
 
-        translate_prompt = f"""Translate the following Italian text to simple, modern English.
-Maintain the exact meaning but use clear, straightforward language.
+    if ratio > 1.8:
+        log_print(f"    ✗ Length ratio {ratio:.2f} exceeds 1.8 (IT:{italian_word_count} EN:{extracted_word_count})")
+        return None
 
-Italian:
-{text_to_translate}
+    # Verify it's actually at the beginning, ignoring case and minor punctuation differences
+    if norton_lower.startswith(extracted_lower) or \
+       norton_lower.startswith(extracted_lower.strip('.,;:!?\'" ')):
+        log_print(f"    ✓ Validated (ratio: {ratio:.2f})")
+        return extracted
 
-Output only the translation, nothing else."""
+    log_print(f"      Not at beginning of Norton text")
+    return None
 
-        llm.history = []
-        translation_response = llm.call(translate_prompt)
-        reference_text = translation_response.strip()
-        log_print(f"    Modern translation: {reference_text}")
 
-    # Stage 2: Find matching text in Norton English
-    length_hint = "SHORT (likely one phrase or clause)" if num_italian_lines == 1 else f"matching {num_italian_lines} Italian lines"
+def extraction_system_prompt(skip_translation: bool = False) -> str:
+    """
+    Build the instructions shared by all extraction requests of a run.
 
-    extract_prompt = f"""Task: Extract the corresponding text from the Norton English translation.
+    They are sent as the session system prompt, so every request starts with
+    the same prefix and the backend can reuse its prompt cache.
 
-Reference meaning (modern English):
-{reference_text}
+    Args:
+        skip_translation: If True, compare with the Italian text directly instead of
+                          paraphrasing it to modern English first
+    """
+    if skip_translation:
+        reference_step = """1. Set modern_translation to an empty string
+2. Use the Italian text directly as the meaning reference"""
+    else:
+        reference_step = """1. Translate the Italian to simple, modern English and put it in modern_translation
+   (maintain the exact meaning but use clear, straightforward language)
+2. Use the modern translation as the meaning reference"""
 
-Source text (Norton's literary translation - extract FROM this text):
-{norton_text[:500]}
+    return f"""You extract the text corresponding to Italian lines of Dante from Norton's English translation.
+Each request gives the original Italian and a passage of Norton's text.
 
 INSTRUCTIONS:
-1. Read the Norton text carefully
-2. Find the portion that means the SAME as the modern translation
-3. The wording will be DIFFERENT (literary vs modern)
-4. Extract the EXACT text from the Norton passage
-5. Start from the very beginning of the Norton text
-6. Extract approximately: {length_hint}
+{reference_step}
+3. Find the portion of the Norton text that means the SAME as the reference
+4. The wording will be DIFFERENT (literary vs modern)
+5. Put the EXACT text from the Norton passage in extracted_text
+6. Start from the very beginning of the Norton text
+7. Extract approximately the amount given in the request
+8. Validate your extraction and answer YES or NO, with a short reason
 
 LENGTH CONSTRAINT:
-- The modern translation above represents ONE line of Italian
 - Extract ONLY a SHORT phrase or clause from the Norton text
 - Do NOT extract multiple sentences
 - When in doubt, extract LESS rather than more
 
-CRITICAL: Output must be the ACTUAL TEXT from the Norton passage above, not a rephrasing.
-
-Output only the extracted Norton English text:"""
-
-    # Try up to 3 times with validation
-    english_text = None
-    last_validation = None
-
-    for retry in range(3):
-        # Step 1: Extract English text (plain text)
-        llm.history = []
-        if retry == 0:
-            response = llm.call(extract_prompt)
-        else:
-            if last_validation == "NO":
-                retry_prompt = f"""Modern English translation:
-{reference_text}
-
-Norton English text (literary translation):
-{norton_text[:500]}
-
-CRITICAL: The previous extraction was INCORRECT.
-
-Find the portion of the Norton text that matches the modern translation above.
-- Extract ONLY the matching portion
-- Do NOT include content from other parts of the Norton text
-- The Italian has {num_italian_lines} line(s), so extract a {length_hint} amount
-
-Output only the extracted Norton English text:"""
-                response = llm.call(retry_prompt)
-            else:
-                response = llm.call(extract_prompt)
-
-        # Use response directly as extracted text
-        # Strip quotes only if text is fully enclosed in matching quotes
-        extracted = response.strip()
-        if (extracted.startswith('"') and extracted.endswith('"')) or \
-           (extracted.startswith("'") and extracted.endswith("'")):
-            extracted = extracted[1:-1]
-
-        # Restore punctuation from original Norton text if missing
-        # Find the position of extracted text in norton_text
-        idx = norton_text.lower().find(extracted.lower())
-        if idx != -1:
-            end_pos = idx + len(extracted)
-            # Check if there's punctuation immediately after in the original
-            if end_pos < len(norton_text):
-                next_char = norton_text[end_pos]
-                if next_char in ',.;:!?' and not extracted.endswith(next_char):
-                    # Add the punctuation if missing
-                    extracted = extracted + next_char
-
-        # Step 2: Validate extraction
-        llm.history = []
-
-        validation_prompt = f"""Modern English (meaning reference):
-{reference_text}
-
-Extracted Norton English:
-{extracted}
-
-Original Italian ({num_italian_lines} line(s)):
-{italian_text}
-
-Question: Does the extracted Norton English convey the same meaning as the modern translation (and thus the original Italian)?
+CRITICAL: extracted_text must be the ACTUAL TEXT from the Norton passage, not a rephrasing.
 
 VALIDATION CRITERIA:
 - The Norton text is a literary translation, so different wording is EXPECTED
 - Focus on SEMANTIC EQUIVALENCE: does it convey the same basic meaning?
 - The extracted text should NOT include content from other Italian lines
-- Length should roughly match ({length_hint})
 
 Answer YES if:
-- The extracted Norton English conveys the same meaning as the modern translation
+- The extracted Norton English conveys the same meaning as the original Italian
 - It does NOT include content from other parts of the text
 
 Answer NO if:
 - The extraction clearly includes content from OTHER parts of the text
 - The extraction is MUCH LONGER than the reference suggests"""
 
-        validation_response = llm.call(
-            validation_prompt,
-            schema=ValidationResult
+
+async def query_word_correspondences(llm: LLMClient, italian_block: List[ItalianLine],
+                                     norton_text: str, skip_translation: bool = False) -> Tuple[str, List[str]] | None:
+    """
+    Query LLM to extract English text corresponding to Italian block.
+    Translation, extraction and validation are combined into a single
+    structured-output call following extraction_system_prompt(); if it is
+    rejected, the same conversation is continued once with a correction.
+
+    Args:
+        skip_translation: If True, no modern translation is requested
+                          (must match the system prompt of llm)
+
+    Returns:
+        Tuple of (extracted text, word list) or None if extraction failed
+    """
+    italian_text = '\n'.join(line.full_text for line in italian_block)
+    num_italian_lines = len(italian_block)
+
+    length_hint = "SHORT (likely one phrase or clause)" if num_italian_lines == 1 else f"matching {num_italian_lines} Italian lines"
+
+    extract_prompt = f"""Task: Extract the corresponding text from the Norton English translation.
+
+Original Italian ({num_italian_lines} line(s)):
+{italian_text}
+
+Source text (Norton's literary translation - extract FROM this text):
+{norton_text[:500]}
+
+Extract approximately: {length_hint}"""
+
+    retry_prompt = f"""CRITICAL: The previous extraction was INCORRECT.
+- Extract ONLY the matching portion
+- Do NOT include content from other parts of the Norton text
+- The Italian has {num_italian_lines} line(s), so extract a {length_hint} amount"""
+
+    # Lowercased once for all attempts
+    norton_lower = norton_text.lower()
+
+    # One combined call; a rejected extraction continues the same conversation
+    # so that the backend can reuse the cached prompt prefix
+    llm.history = []
+    for retry in range(2):
+        response = await llm.acall(
+            extract_prompt if retry == 0 else retry_prompt,
+            schema=ExtractAndValidate
         )
 
         # Parse JSON response
-        validation_data = json.loads(validation_response)
-        answer = validation_data["answer"]
-
-        log_print(f"    Extracted: {extracted[:100]}{'...' if len(extracted) > 100 else ''}")
-        log_print(f"    LLM validation: {answer}")
-
-        # Step 3: Process validation result
-        if answer == "YES":
-            # Length ratio check (hard constraint)
-            italian_word_count = len(italian_text.split())
-            extracted_word_count = len(extracted.split())
-            ratio = extracted_word_count / italian_word_count if italian_word_count > 0 else 0
-
-            if ratio > 1.8:
-                log_print(f"    ✗ Length ratio {ratio:.2f} exceeds 1.8 (IT:{italian_word_count} EN:{extracted_word_count})")
-                last_validation = "NO"
-                continue
-
-            # Verify it's actually at the beginning
-            if norton_text.startswith(extracted):
-                english_text = extracted
-                log_print(f"    ✓ Validated (ratio: {ratio:.2f})")
-                break
-            else:
-                # LLM says correct but not at beginning - try to find best match
-                extracted_normalized = extracted.lower().strip('.,;:!?\'" ')
-                norton_normalized = norton_text.lower()
-
-                if norton_normalized.startswith(extracted_normalized):
-                    # Minor punctuation difference
-                    english_text = extracted
-                    log_print(f"    ✓ Validated (normalized, ratio: {ratio:.2f})")
-                    break
-                else:
-                    log_print(f"      Not at beginning of Norton text")
-                    last_validation = "NO"
-        else:  # answer == "NO"
-            log_print(f"      Validation failed")
-            last_validation = "NO"
+        english_text = check_extraction(json_loads(response), italian_block, norton_text,
+                                        skip_translation, norton_lower)
+        if english_text:
+            break
 
     # Check if we succeeded
     if english_text:
         return (english_text, english_text.split())
     else:
-        # Failed after 3 attempts - return None to signal caller to try with more lines
-        log_print(f"    ✗ Failed after 3 attempts - need more context")
+        # Failed after retry - return None to signal caller to try with more lines
+        log_print(f"    ✗ Failed after 2 attempts - need more context")
         return None
 
 
+async def query_word_correspondences_batch(llm: LLMClient, italian_block: List[ItalianLine],
+                                           norton_text: str, skip_translation: bool = False) -> List[Tuple[str, List[str]]]:
+    """
+    Query LLM to extract English text for several consecutive Italian lines at once.
+    The Norton passage is sent only once for all lines.
+
+    Args:
+        skip_translation: If True, no modern translation is requested
+                          (must match the system prompt of llm)
+
+    Returns:
+        List of (extracted text, word list) for the leading lines that passed
+        validation, in order (empty if the first line failed)
+    """
+    numbered_lines = '\n'.join(f"{i}. {line.full_text}" for i, line in enumerate(italian_block, 1))
+    num_italian_lines = len(italian_block)
+
+    batch_prompt = f"""Task: Extract the corresponding text from the Norton English translation for each Italian line.
+
+Original Italian ({num_italian_lines} lines, numbered):
+{numbered_lines}
+
+Source text (Norton's literary translation - extract FROM this text):
+{norton_text[:500]}
+
+Return exactly {num_italian_lines} items, one per Italian line, in the same order.
+- The first item starts from the very beginning of the Norton text;
+  each following item starts right where the previous one ended
+- Extract approximately: SHORT (likely one phrase or clause) per line
+- Do NOT include content belonging to neighbouring lines
+- Answer NO for a line whose meaning does not appear at that position of the Norton text"""
+
+    llm.history = []
+    response = await llm.acall(batch_prompt, schema=BatchExtraction)
+    items = json_loads(response)["items"]
+
+    # Accept items in order while each one starts the remaining Norton text
+    results = []
+    remaining_text = norton_text
+    for line, data in zip(italian_block, items):
+        log_print(f"  Line {line.line_num}: {line.full_text} (batch)")
+        extracted = check_extraction(data, [line], remaining_text, skip_translation)
+        if not extracted:
+            break
+        results.append((extracted, extracted.split()))
+        remaining_text = remaining_text[len(extracted):].lstrip(_PUNCT_WS)
+    return results
+
+
 def consume_matched_text(text: str, matched_words: List[str]) -> str:
     """
     Remove continuously matched words from the beginning of text.
     Stop at first gap.
     """
-    result = text
+    # Walk an index through text and slice only once at the end
+    pos = 0
+    n = len(text)
 
     for word in matched_words:
-        result = result.lstrip(" ,;.!?")
-        if result.startswith(word):
-            result = result[len(word):]
+        while pos < n and text[pos] in _PUNCT_WS:
+            pos += 1
+        if text.startswith(word, pos):
+            pos += len(word)
         else:
             break
 
-    return result.lstrip(" ,;.!?")
+    while pos < n and text[pos] in _PUNCT_WS:
+        pos += 1
+    return text[pos:]
 
 
-def align_paragraph(llm: LLMClient, italian_lines: List[ItalianLine],
-                    norton_paragraph: str, start_idx: int,
-                    skip_translation: bool = False) -> Tuple[AlignmentBlock, int, str]:
+async def align_paragraph(llm: LLMClient, italian_lines: List[ItalianLine],
+                          norton_paragraph: str, start_idx: int,
+                          skip_translation: bool = False) -> Tuple[AlignmentBlock, int, str]:
     """
     Align Italian lines to a Norton paragraph, finding the block boundary.
 
+    The block grows one line at a time until it is complete. Completeness is
+    not monotonic in the block size (a block that ends mid-clause fails even
+    if a shorter one succeeded), so sizes cannot be skipped or bisected.
+
     Args:
         llm: LLM client for word correspondence queries
         italian_lines: Full list of Italian lines
@@ -349,78 +442,186 @@ def align_paragraph(llm: LLMClient, italian_lines: List[ItalianLine],
     Returns:
         Tuple of (AlignmentBlock, next_start_idx, remaining_paragraph_text)
     """
-    italian_block = []
-    idx = start_idx
-
-    while idx < len(italian_lines):
-        # Add next Italian line to block
-        italian_block.append(italian_lines[idx])
-        idx += 1
-
-        log_print(f"  Line {italian_block[-1].line_num}: {italian_block[-1].full_text}")
+    async def probe(size: int) -> str | None:
+        """Return the extracted text if the first size lines form a complete block."""
+        italian_block = italian_lines[start_idx:start_idx + size]
+        log_print(f"  Line {italian_block[-1].line_num}: {italian_block[-1].full_text} ({size} line(s))")
 
         # Query LLM for word correspondences
-        result = query_word_correspondences(llm, italian_block, norton_paragraph, skip_translation)
+        result = await query_word_correspondences(llm, italian_block, norton_paragraph, skip_translation)
 
         # If extraction failed, try with more lines (enjambment case)
         if result is None:
-            log_print(f"    → Failed with {len(italian_block)} line(s), trying with more context")
-            continue
+            log_print(f"    → Failed with {size} line(s), trying with more context")
+            return None
 
         extracted_text, matched_words = result
         log_print(f"    → {matched_words}")
 
         # Check if block is complete
-        if is_block_complete(norton_paragraph, matched_words):
-            # Use the extracted text directly (preserves punctuation)
-            matched_text = extracted_text
-            log_print(f"    ✓ Complete: {matched_text}")
+        if not is_block_complete(norton_paragraph, matched_words):
+            log_print(f"    → Continue")
+            return None
+
+        return extracted_text
+
+    # Add Italian lines one at a time until the block is complete
+    for size in range(1, len(italian_lines) - start_idx + 1):
+        if (matched_text := await probe(size)) is not None:
+            break
+    else:
+        # Reached end
+        block = AlignmentBlock(italian_lines[start_idx:], norton_paragraph)
+        return block, len(italian_lines), ""
+
+    # Use the extracted text directly (preserves punctuation)
+    log_print(f"    ✓ Complete: {matched_text}")
+
+    block = AlignmentBlock(italian_lines[start_idx:start_idx + size], norton_paragraph, matched_text)
+    remaining_text = norton_paragraph[len(matched_text):].lstrip(_PUNCT_WS)
+
+    return block, start_idx + size, remaining_text
+
+
+async def align_batch(llm: LLMClient, italian_lines: List[ItalianLine],
+                      norton_paragraph: str, start_idx: int, batch_size: int,
+                      skip_translation: bool = False) -> Tuple[List[AlignmentBlock], int, str]:
+    """
+    Speculatively align up to batch_size single-line blocks with one LLM call.
+
+    Lines are accepted in order while their extraction is valid and forms a
+    complete block; the first failure ends the batch.
+
+    Returns:
+        Tuple of (accepted AlignmentBlocks, next_start_idx, remaining_paragraph_text)
+    """
+    batch = italian_lines[start_idx:start_idx + batch_size]
+    results = await query_word_correspondences_batch(llm, batch, norton_paragraph, skip_translation)
+
+    blocks = []
+    idx = start_idx
+    remaining_text = norton_paragraph
+
+    for line, (extracted_text, matched_words) in zip(batch, results):
+        if not is_block_complete(remaining_text, matched_words):
+            break
+        log_print(f"    ✓ Complete: {extracted_text}")
+        blocks.append(AlignmentBlock([line], remaining_text, extracted_text))
+        remaining_text = remaining_text[len(extracted_text):].lstrip(_PUNCT_WS)
+        idx += 1
+        if not remaining_text.strip():
+            break
 
-            block = AlignmentBlock(italian_block, norton_paragraph, matched_text)
-            remaining_text = norton_paragraph[len(matched_text):].lstrip(" ,;.!?")
+    return blocks, idx, remaining_text
 
-            return block, idx, remaining_text
 
-        log_print(f"    → Continue")
+async def align_norton_paragraph(llm: LLMClient, italian_lines: List[ItalianLine],
+                                 norton_paragraph: str, start_idx: int,
+                                 skip_translation: bool = False,
+                                 batch_size: int = 4) -> Tuple[List[AlignmentBlock], int]:
+    """
+    Align a whole Norton paragraph, splitting it into as many blocks as needed.
 
-    # Reached end
-    block = AlignmentBlock(italian_block, norton_paragraph)
-    return block, idx, ""
+    Args:
+        llm: LLM client for word correspondence queries
+        italian_lines: Full list of Italian lines
+        norton_paragraph: Norton English paragraph text (annotation markers removed)
+        start_idx: Starting index in italian_lines
+        skip_translation: If True, use Italian directly instead of translating
+        batch_size: Number of lines tried in one batched call (1 disables batching)
 
+    Returns:
+        Tuple of (AlignmentBlocks, next_start_idx)
+    """
+    blocks = []
+    idx = start_idx
+    remaining_text = norton_paragraph
+
+    while remaining_text.strip() and idx < len(italian_lines):
+        # Try several single-line blocks at once first
+        if batch_size > 1 and len(italian_lines) - idx > 1:
+            batch_blocks, idx, remaining_text = await align_batch(
+                llm, italian_lines, remaining_text, idx, batch_size, skip_translation
+            )
+            if batch_blocks:
+                blocks.extend(batch_blocks)
+                log_print()
+                continue
+            log_print(f"    → Batch failed, falling back to single lines")
+
+        # Align this block
+        block, idx, remaining_text = await align_paragraph(
+            llm, italian_lines, remaining_text, idx, skip_translation
+        )
+        blocks.append(block)
+        log_print()
+
+    return blocks, idx
 
-def align_canto(llm: LLMClient, italian_filepath: str, norton_filepath: str,
-                max_lines: int | None = None, log_file = None,
-                skip_translation: bool = False) -> List[AlignmentBlock]:
+
+def estimate_start_indices(paragraphs: List[str], num_lines: int) -> List[int]:
+    """
+    Estimate the first Italian line of each paragraph by word-count ratio.
+
+    Args:
+        paragraphs: Norton paragraphs to be aligned
+        num_lines: Number of Italian lines in the whole canto
+
+    Returns:
+        Estimated start index in the Italian lines for each paragraph
+    """
+    word_counts = [len(p.split()) for p in paragraphs]
+    total = sum(word_counts) or 1
+    starts = []
+    words = 0
+    for count in word_counts:
+        starts.append(round(words / total * num_lines))
+        words += count
+    return starts
+
+
+async def align_canto(llm: LLMClient, italian_filepath: str, norton_filepath: str,
+                      max_lines: int | None = None, log_file = None,
+                      skip_translation: bool = False, concurrency: int = 1,
+                      batch_size: int = 4) -> List[AlignmentBlock]:
     """
     Align a full canto (Italian and Norton translation).
 
+    With concurrency > 1, paragraphs are aligned concurrently from estimated
+    Italian start lines. The results are then taken in paragraph order: each
+    result whose estimate matched the actual boundary is accepted, and the
+    mispredicted paragraphs are re-aligned. One of the slots is reserved for
+    the re-alignment, so it never waits behind speculative work. With
+    concurrency 1, paragraphs are aligned one after another from their
+    actual start.
+
     Args:
         llm: LLM client for word correspondence queries
         italian_filepath: Path to tokenize/inferno/*.txt file
         norton_filepath: Path to en-norton/inferno/*.txt file
         max_lines: Maximum number of Italian lines to process (for testing)
         skip_translation: If True, use Italian directly instead of translating
+        concurrency: Maximum number of paragraphs aligned at the same time
+                     (1 disables speculative alignment)
+        batch_size: Number of lines tried in one batched call (1 disables batching)
 
     Returns:
         List of AlignmentBlocks
     """
     # Load Italian lines
     italian_lines = load_italian_lines(italian_filepath)
+    num_canto_lines = len(italian_lines)
     if max_lines is not None:
         italian_lines = italian_lines[:max_lines]
 
-    # Load Norton text
-    with open(norton_filepath, 'r', encoding='utf-8') as f:
-        norton_text = f.read()
-    norton_canto = Canto(norton_text)
+    # Load Norton text (parse result is cached next to the file)
+    norton_canto = Canto.from_file(norton_filepath)
 
     log_print(f"Processing {len(italian_lines)} Italian lines")
     log_print()
 
-    # Process each Norton paragraph
-    blocks = []
-    italian_idx = 0
-
+    # Collect Norton paragraphs to align
+    paragraphs = []
     for para_num, (norton_paragraph, _) in enumerate(norton_canto.lines, 1):
         # Skip empty paragraphs
         if not norton_paragraph.strip():
@@ -430,30 +631,89 @@ def align_canto(llm: LLMClient, italian_filepath: str, norton_filepath: str,
         if para_num == 1:
             continue
 
-        log_print(f"Paragraph {para_num}: {norton_paragraph[:60]}...")
-
         # Remove annotation markers
-        clean_paragraph = re.sub(r'\[\d+\]', '', norton_paragraph)
-
-        # Process multiple blocks within this paragraph
-        remaining_text = clean_paragraph
-        block_num = 1
-
-        while remaining_text.strip() and italian_idx < len(italian_lines):
-            # Align this block
-            block, italian_idx, remaining_text = align_paragraph(
-                llm, italian_lines, remaining_text, italian_idx, skip_translation
+        clean_paragraph = _ANNO_MARKER.sub('', norton_paragraph)
+        paragraphs.append((para_num, norton_paragraph, clean_paragraph))
+
+    system_prompt = extraction_system_prompt(skip_translation)
+
+    async def run(para_num: int, norton_paragraph: str, clean_paragraph: str,
+                  start_idx: int) -> Tuple[List[AlignmentBlock], int, str]:
+        buffer = io.StringIO()
+        token = _log_buffer.set(buffer)
+        try:
+            log_print(f"Paragraph {para_num}: {norton_paragraph[:60]}...")
+            client = llm.copy()
+            client.session_system_prompt = system_prompt
+            result, next_idx = await align_norton_paragraph(
+                client, italian_lines, clean_paragraph, start_idx, skip_translation, batch_size
             )
-            blocks.append(block)
-            block_num += 1
-            log_print()
+        finally:
+            _log_buffer.reset(token)
+        return result, next_idx, buffer.getvalue()
+
+    blocks = []
+    italian_idx = 0
 
+    def accept(result: Tuple[List[AlignmentBlock], int, str]) -> None:
+        nonlocal italian_idx
+        para_blocks, italian_idx, log_text = result
+        if _log_file:
+            _log_file.write(log_text)
+            flush_log()
+        blocks.extend(para_blocks)
+
+    if concurrency <= 1:
+        # Serial walk: a wrong guess could only add calls, never save time
+        for paragraph in paragraphs:
+            if italian_idx >= len(italian_lines):
+                break
+            accept(await run(*paragraph, italian_idx))
+        return blocks
+
+    # Speculative tasks share all slots but one; the re-alignment awaited below
+    # runs in the remaining slot, so it never queues behind speculative work
+    semaphore = asyncio.Semaphore(concurrency - 1)
+
+    async def speculate(*args) -> Tuple[List[AlignmentBlock], int, str]:
+        async with semaphore:
+            return await run(*args)
+
+    # Speculative pass: start all paragraphs concurrently from estimated starts
+    estimates = estimate_start_indices([p[2] for p in paragraphs], num_canto_lines)
+    tasks = [
+        asyncio.create_task(speculate(*paragraph, start)) if start < len(italian_lines) else None
+        for paragraph, start in zip(paragraphs, estimates)
+    ]
+
+    # Reconcile in paragraph order: accept a result whose estimated start was
+    # right, otherwise re-align from the actual start
+    hits = 0
+    try:
+        for i, (paragraph, start) in enumerate(zip(paragraphs, estimates)):
             if italian_idx >= len(italian_lines):
                 break
 
-        if italian_idx >= len(italian_lines):
-            break
+            # Starts only move forward, so estimates before the actual start are
+            # already known to be wrong; stop them instead of waiting for them
+            for later, later_start in zip(tasks[i:], estimates[i:]):
+                if later and later_start < italian_idx and not later.cancelling():
+                    later.cancel()
 
+            if tasks[i] and start == italian_idx:
+                hits += 1
+                accept(await tasks[i])
+            else:
+                log_print(f"Paragraph {paragraph[0]}: estimated line {start + 1}, actual line {italian_idx + 1}, re-aligning")
+                accept(await run(*paragraph, italian_idx))
+    finally:
+        # Stop the speculative work that is no longer needed
+        for task in tasks:
+            if task and not task.cancelling():
+                task.cancel()
+        await asyncio.gather(*[task for task in tasks if task], return_exceptions=True)
+
+    log_print(f"Speculation: {hits}/{len(paragraphs)} paragraph starts estimated correctly")
     return blocks
 
 
@@ -492,7 +752,7 @@ def format_aligned_output(blocks: List[AlignmentBlock]) -> str:
     return '\n'.join(lines)
 
 
-def main():
+async def main():
     """Main entry point"""
     import argparse
 
@@ -503,6 +763,9 @@ def main():
     parser.add_argument('--temperature', type=float, default=0.3, help='LLM temperature (default: 0.3)')
     parser.add_argument('--think', action='store_true', help='Enable LLM thinking (disabled by default)')
     parser.add_argument('--translate', action='store_true', help='Translate Italian to English before matching (default: use Italian directly)')
+    parser.add_argument('--concurrency', type=int, default=1, help='Max paragraphs aligned concurrently, 1 to align serially without speculation (default: 1)')
+    parser.add_argument('--no-cache', action='store_true', help='Do not use the LLM response cache in alignment/.cache')
+    parser.add_argument('--batch-size', type=int, default=4, help='Italian lines per batched extraction call, 1 to disable (default: 4)')
 
     args = parser.parse_args()
 
@@ -523,10 +786,17 @@ def main():
         log_print()
 
         # Create LLM client
-        llm = LLMClient(model=args.model, think=args.think, temperature=args.temperature)
+        llm = LLMClient(model=args.model, think=args.think, temperature=args.temperature,
+                        cache_dir=None if args.no_cache else "alignment/.cache")
+
+        # Load the model before aligning so that the first requests do not wait for it
+        if not llm.preload() and args.model.startswith('ollama:'):
+            log_print("Model preload skipped (ollama package or server not available)")
 
         # Align the canto
-        blocks = align_canto(llm, italian_file, norton_file, max_lines=args.max_lines, skip_translation=not args.translate)
+        blocks = await align_canto(llm, italian_file, norton_file, max_lines=args.max_lines,
+                                   skip_translation=not args.translate, concurrency=args.concurrency,
+                                   batch_size=args.batch_size)
 
         # Write results to log
         log_print()
@@ -556,4 +826,4 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+"""
+Regression checks for align_canto.py with a scripted LLM (no model needed).
+
+Run with: uv run --with pytest pytest alignment
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import align_canto
+
+
+def make_lines(count: int):
+    lines = []
+    for line_num in range(1, count + 1):
+        line = align_canto.ItalianLine(f"verso {line_num}|verso|{line_num}")
+        line.line_num = line_num
+        lines.append(line)
+    return lines
+
+
+def test_enjambment_takes_smallest_complete_block(monkeypatch):
+    """A 5-line clause followed by a 2-line clause gives blocks of 5 and 2 lines."""
+    lines = make_lines(7)
+    # Italian line ranges of each clause and its English translation
+    clauses = [(0, 5, "Midway upon the journey of our life,"), (5, 7, "I found myself.")]
+
+    async def query(llm, italian_block, norton_paragraph, skip_translation):
+        start = lines.index(italian_block[0])
+        end = start + len(italian_block)
+        # A block ending mid-clause cannot be extracted
+        if end not in [clause_end for _, clause_end, _ in clauses]:
+            return None
+        text = " ".join(english for s, e, english in clauses if start <= s and e <= end)
+        return text, text.replace(",", "").replace(".", "").split()
+
+    monkeypatch.setattr(align_canto, "query_word_correspondences", query)
+    paragraph = " ".join(english for _, _, english in clauses)
+    blocks, next_idx = asyncio.run(align_canto.align_norton_paragraph(
+        None, lines, paragraph, 0, batch_size=1
+    ))
+
+    assert [[line.line_num for line in block.italian_lines] for block in blocks] == [[1, 2, 3, 4, 5], [6, 7]]
+    assert next_idx == 7
@@ -5,20 +5,54 @@ Provides a wrapper around llm7shi for managing conversation history
 and converting history to/from XML format for persistence.
 """
 
+import io
+import os
+import json
+import asyncio
+import hashlib
+import threading
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Dict, Optional, Any
-from xml.dom.minidom import Document, parseString
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
 from llm7shi.compat import generate_with_schema
 
 
+@lru_cache(maxsize=None)
+def _model_schema_json(model: type) -> str:
+    """Return the JSON schema of a Pydantic model as a canonical string."""
+    return json.dumps(model.model_json_schema(), sort_keys=True)
+
+
+def _schema_key(schema: Any) -> Any:
+    """
+    Return a JSON-serializable cache key for a schema.
+
+    Pydantic models are keyed by their JSON schema rather than their name, so
+    that a changed field or description does not reuse responses of the old
+    schema. Other classes are keyed by name, and other schemas (dicts or None)
+    are used as they are.
+    """
+    if isinstance(schema, type):
+        if hasattr(schema, 'model_json_schema'):
+            return _model_schema_json(schema)
+        return schema.__name__
+    return schema
+
+
 class LLMClient:
     """
     Client for interacting with language models via llm7shi.
 
     Manages conversation history and provides methods for making LLM calls
-    with automatic history tracking.
+    with automatic history tracking. Responses can optionally be cached on disk
+    so that identical requests are not sent again on later runs.
     """
 
-    def __init__(self, model: str, think: bool, temperature: float = 1.0):
+    def __init__(self, model: str, think: bool, temperature: float = 1.0,
+                 cache_dir: Optional[str | Path] = None,
+                 session_system_prompt: Optional[str] = None):
         """
         Initialize the LLM client.
 
@@ -26,40 +60,55 @@ class LLMClient:
             model: Model identifier to use
             think: Whether to include thinking in responses
             temperature: Sampling temperature (default: 1.0)
+            cache_dir: Optional directory for the response cache (disabled if None)
+            session_system_prompt: Optional system prompt sent first in every call
+                                   (not stored in history), so that all requests
+                                   share a prefix the backend can cache
         """
         self.model: str = model
         self.think: bool = think
         self.temperature: float = temperature
+        self.cache_dir: Optional[Path] = Path(cache_dir) if cache_dir else None
+        self.session_system_prompt: Optional[str] = session_system_prompt
         self.history: List[Dict[str, str]] = []
+        # In-memory responses of this session, shared with copies
+        self._memo: Dict[tuple, str] = {}
 
     def copy(self) -> 'LLMClient':
         """
         Create a copy of the LLMClient with the same model, think setting, and history.
+        The in-memory response memo is shared with the copy.
 
         Returns:
             New LLMClient instance with copied history
         """
-        new_client = LLMClient(self.model, self.think, self.temperature)
+        new_client = LLMClient(self.model, self.think, self.temperature,
+                               self.cache_dir, self.session_system_prompt)
         new_client.history = self.history.copy()
+        new_client._memo = self._memo
         return new_client
 
-    def call(self, prompt: str, system_prompt: Optional[str] = None, schema: Any = None) -> str:
-        """
-        Call LLM and automatically add query/response to history.
+    def clear_memo(self) -> None:
+        """Clear the in-memory response memo (shared with copies)."""
+        self._memo.clear()
 
-        Args:
-            prompt: User prompt text
-            system_prompt: Optional system prompt (used only for first call)
-            schema: Optional JSON schema or Pydantic model for structured output
+    def _cache_path(self, messages: List[Dict[str, str]], schema: Any) -> Path:
+        """Return the cache file for a request, keyed by a hash of its parameters."""
+        key_data = {
+            'model': self.model,
+            'temperature': self.temperature,
+            'think': self.think,
+            'schema': _schema_key(schema),
+            'messages': messages,
+        }
+        key = hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.txt"
 
-        Returns:
-            Response text from LLM
-        """
-        messages = []
-        if system_prompt:
-            messages.append({'role': 'system', 'content': system_prompt})
-        messages.extend(self.history)
-        messages.append({'role': 'user', 'content': prompt})
+    def _cached_generate(self, messages: List[Dict[str, str]], schema: Any, use_cache: bool) -> str:
+        """Generate a response, reading and writing the disk cache if enabled."""
+        cache_path = self._cache_path(messages, schema) if self.cache_dir and use_cache else None
+        if cache_path and cache_path.exists():
+            return cache_path.read_text(encoding='utf-8')
 
         response = generate_with_schema(
             messages,
@@ -70,15 +119,127 @@ class LLMClient:
             show_params=False,
         )
         response_text = response.text.strip()
+        if cache_path:
+            # Write to a temporary file first so that readers never see a partial entry
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(response_text, encoding='utf-8')
+            tmp_path.replace(cache_path)
+        return response_text
+
+    def call(self, prompt: str, system_prompt: Optional[str] = None, schema: Any = None,
+             use_cache: bool = True) -> str:
+        """
+        Call LLM and automatically add query/response to history.
+
+        Args:
+            prompt: User prompt text
+            system_prompt: Optional system prompt (used only for first call)
+            schema: Optional JSON schema or Pydantic model for structured output
+            use_cache: Whether to reuse earlier responses (in-memory memo unless
+                       temperature > 0.5, and the disk cache if cache_dir is set);
+                       pass False to get a fresh sample at temperature > 0
 
-        # Automatically add to history
+        Returns:
+            Response text from LLM
+        """
+        # Add the query to history first and send the history itself as messages
+        history_len = len(self.history)
         if system_prompt:
             self.history.append({'role': 'system', 'content': system_prompt})
         self.history.append({'role': 'user', 'content': prompt})
+        messages = self.history
+        if self.session_system_prompt:
+            messages = [{'role': 'system', 'content': self.session_system_prompt}, *self.history]
+
+        memo_key = None
+        if use_cache and self.temperature <= 0.5:
+            memo_key = (
+                self.model, self.temperature, self.think,
+                repr(_schema_key(schema)),
+                tuple((m['role'], m['content']) for m in messages),
+            )
+
+        try:
+            if memo_key and memo_key in self._memo:
+                response_text = self._memo[memo_key]
+            else:
+                response_text = self._cached_generate(messages, schema, use_cache)
+        except BaseException:
+            # Leave the history unchanged if the call failed
+            del self.history[history_len:]
+            raise
+
+        if memo_key:
+            self._memo[memo_key] = response_text
+
         self.history.append({'role': 'assistant', 'content': response_text})
 
         return response_text
 
+    def preload(self) -> bool:
+        """
+        Load the model into memory before the first call (Ollama models only).
+
+        Avoids paying the model load time on the first request. The model stays
+        loaded for the server's default keep-alive. This is best-effort: if the
+        ollama package is not installed or the server cannot be reached, nothing
+        is loaded and the first call loads the model as usual.
+
+        Returns:
+            True if the model was loaded, False otherwise
+        """
+        if not self.model.startswith('ollama:'):
+            return False
+        try:
+            # Installed as a dependency of llm7shi, not required by this package
+            import ollama
+        except ImportError:
+            return False
+        try:
+            # A request without a prompt only loads the model
+            ollama.generate(model=self.model.removeprefix('ollama:'))
+        except Exception:
+            # Connection or server errors surface again on the first real call
+            return False
+        return True
+
+    async def acall(self, prompt: str, system_prompt: Optional[str] = None, schema: Any = None,
+                    use_cache: bool = True) -> str:
+        """
+        Asynchronous version of call().
+
+        llm7shi only provides a blocking API, so the request is run in a worker
+        thread. Concurrent calls must use separate clients (see copy()), since
+        each call updates the history. A running request cannot be interrupted,
+        so on cancellation this waits for it to finish before re-raising; a
+        caller limiting concurrency does not free its slot too early.
+
+        Args:
+            prompt: User prompt text
+            system_prompt: Optional system prompt (used only for first call)
+            schema: Optional JSON schema or Pydantic model for structured output
+            use_cache: Whether to use the response cache (if cache_dir is set)
+
+        Returns:
+            Response text from LLM
+        """
+        task = asyncio.ensure_future(asyncio.to_thread(self.call, prompt, system_prompt, schema, use_cache))
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            while not task.done():
+                try:
+                    await asyncio.wait([task])
+                except asyncio.CancelledError:
+                    pass
+            if not task.cancelled():
+                task.exception()  # Mark as retrieved
+            raise
+
+# Characters escaped in attribute values besides &, < and > (as minidom does)
+_ATTR_ENTITIES = {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'}
+
 def history_to_xml(history: List[Dict[str, str]]) -> str:
     """
     Convert LLM interaction history to XML format.
@@ -89,17 +250,20 @@ def history_to_xml(history: List[Dict[str, str]]) -> str:
     Returns:
         XML string representing the history
     """
-    doc = Document()
-    messages = doc.createElement("messages")
-    doc.appendChild(messages)
+    if not history:
+        return '<?xml version="1.0" encoding="utf-8"?>\n<messages/>\n'
+    parts = ['<?xml version="1.0" encoding="utf-8"?>', '<messages>']
     for msg in history:
-        message = doc.createElement("message")
-        message.setAttribute("role", msg["role"])
+        role = escape(msg["role"], _ATTR_ENTITIES)
         content = msg["content"].rstrip()
         if content:
-            message.appendChild(doc.createCDATASection(f"\n{content}\n"))
-        messages.appendChild(message)
-    return doc.toprettyxml(encoding='utf-8', indent='').decode('utf-8')
+            # "]]>" cannot appear inside CDATA, so split it across two sections
+            content = content.replace("]]>", "]]]]><![CDATA[>")
+            parts.append(f'<message role="{role}"><![CDATA[\n{content}\n]]></message>')
+        else:
+            parts.append(f'<message role="{role}"/>')
+    parts.append('</messages>\n')
+    return '\n'.join(parts)
 
 def xml_to_history(xml_string: str) -> List[Dict[str, str]]:
     """
@@ -111,16 +275,15 @@ def xml_to_history(xml_string: str) -> List[Dict[str, str]]:
     Returns:
         List of message dictionaries with 'role' and 'content'
     """
-    doc = parseString(xml_string)
     history = []
-    for message in doc.getElementsByTagName("message"):
-        role = message.getAttribute("role")
-        content = ""
-        for child in message.childNodes:
-            if child.nodeType == child.CDATA_SECTION_NODE:
-                content = child.data
-                if content.startswith('\n'):
-                    content = content[1:]
-                break
+    # Stream the messages instead of building the whole tree
+    for _, element in ElementTree.iterparse(io.BytesIO(xml_string.encode('utf-8'))):
+        if element.tag != "message":
+            continue
+        role = element.get("role", "")
+        content = element.text or ""
+        if content.startswith('\n'):
+            content = content[1:]
         history.append({"role": role, "content": content})
+        element.clear()
     return history
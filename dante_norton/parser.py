@@ -4,8 +4,22 @@ Canto parser for Dante's Divine Comedy text files.
 
 import re
 import json
+from pathlib import Path
 from typing import List, Tuple
 
+# Annotation marker anywhere in text, e.g. "[12]"
+_ANNO_MARKER = re.compile(r'\[\d+\]')
+# Annotation number at the start of an annotation section
+_ANNO_LEAD = re.compile(r'^\[(\d+)\]')
+# Annotation numbers referenced in a text section
+_REF_ALL = re.compile(r'\[(\d+)\]')
+# One or more blank (whitespace-only) lines between sections
+_BLANK = re.compile(r'\n\s*\n')
+
+# Version of the parse result stored by Canto.from_file(); increase it when
+# the parser changes so that existing caches are ignored
+_PARSER_VERSION = 1
+
 
 class Canto:
     """
@@ -29,6 +43,45 @@ class Canto:
         self.lines: List[Tuple[str, List[str]]] = []
         self._parse(text)
     
+    @classmethod
+    def from_file(cls, path: str | Path) -> 'Canto':
+        """
+        Load and parse a canto file, using a cached parse result if available.
+        
+        The parsed lines are stored as <path>.parsed.json next to the source
+        and reused as long as the cache is not older than the source and was
+        written by the same _PARSER_VERSION for a source of the same size.
+        
+        Args:
+            path: Path to the canto text file
+            
+        Returns:
+            Parsed Canto
+        """
+        path = Path(path)
+        cache_path = path.with_name(path.name + '.parsed.json')
+        
+        stat = path.stat()
+        if cache_path.exists() and cache_path.stat().st_mtime >= stat.st_mtime:
+            try:
+                data = json.loads(cache_path.read_text(encoding='utf-8'))
+            except ValueError:
+                data = None
+            # Older caches are a bare list of lines and are parsed again
+            if isinstance(data, dict) and data.get('version') == _PARSER_VERSION \
+                    and data.get('size') == stat.st_size:
+                canto = cls.__new__(cls)
+                canto.lines = [(text, annotations) for text, annotations in data['lines']]
+                return canto
+        
+        canto = cls(path.read_text(encoding='utf-8'))
+        data = {'version': _PARSER_VERSION, 'size': stat.st_size, 'lines': canto.lines}
+        try:
+            cache_path.write_text(json.dumps(data, ensure_ascii=False), encoding='utf-8')
+        except OSError:
+            pass  # Caching is optional (e.g. read-only source directory)
+        return canto
+    
     def _parse(self, text: str) -> None:
         """Parse the text into lines with annotations."""
         # Split into sections (separated by empty lines)
@@ -48,7 +101,7 @@ class Canto:
                     anno_section = sections[i]
                     anno_text = ' '.join(anno_section)
                     # 注釈全体を [1] 付きで保持
-                    match = re.match(r'^\[(\d+)\]', anno_text)
+                    match = _ANNO_LEAD.match(anno_text)
                     if match:
                         num = int(match.group(1))
                         local_annotations[num] = anno_text
@@ -59,8 +112,7 @@ class Canto:
                     # Update the last text section with these annotations
                     last_text, last_annos = self.lines[-1]
                     # Find references in the last text section
-                    ref_pattern = re.compile(r'\[(\d+)\]')
-                    refs = ref_pattern.findall(last_text)
+                    refs = _REF_ALL.findall(last_text)
                     
                     # Add annotations for found references
                     for ref in refs:
@@ -78,28 +130,16 @@ class Canto:
         if not section:
             return False
         first_line = section[0].strip()
-        return bool(re.match(r'^\[\d+\]', first_line))
+        return bool(_ANNO_MARKER.match(first_line))
     
     def _split_into_sections(self, text: str) -> List[List[str]]:
         """Split text into sections separated by empty lines."""
-        lines = text.split('\n')
         sections: List[List[str]] = []
-        current_section: List[str] = []
-        
-        for line in lines:
-            stripped = line.strip()
-            if stripped == '':
-                # Empty line - end current section if it has content
-                if current_section:
-                    sections.append(current_section)
-                    current_section = []
-            else:
-                current_section.append(stripped)
-        
-        # Don't forget the last section
-        if current_section:
-            sections.append(current_section)
-        
+        for section_text in _BLANK.split(text):
+            # Whitespace-only lines at the text boundaries are not matched by _BLANK
+            section = [stripped for line in section_text.split('\n') if (stripped := line.strip())]
+            if section:
+                sections.append(section)
         return sections
     
     def get_text_without_annotations(self, line_idx: int) -> str:
@@ -116,7 +156,7 @@ class Canto:
             raise IndexError(f"Line index {line_idx} out of range")
         
         text = self.lines[line_idx][0]
-        return re.sub(r'\[\d+\]', '', text)
+        return _ANNO_MARKER.sub('', text)
     
     def get_full_text_without_annotations(self) -> str:
         """
@@ -127,7 +167,7 @@ class Canto:
         """
         texts = []
         for text, _ in self.lines:
-            clean_text = re.sub(r'\[\d+\]', '', text)
+            clean_text = _ANNO_MARKER.sub('', text)
             texts.append(clean_text)
         return '\n\n'.join(texts)
 
@@ -0,0 +1,74 @@
+"""
+Splitter for Project Gutenberg texts of the Divine Comedy.
+
+Writes each canto of the input to <section>/<number>.txt, shared by
+en-norton/split.py and it/split.py.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, TextIO
+
+from .utils import roman_number
+
+
+def split_cantos(stdin: TextIO, sections: Dict[str, str], canto_pattern: re.Pattern,
+                 canto_follows_section: bool = False, keep_blank_lines: bool = True,
+                 final_newline: bool = False) -> None:
+    """
+    Split a Project Gutenberg text into one file per canto.
+
+    Section marker lines select the output directory, canto headers select
+    the file number, and the text ends at the "*** END" line. Other lines
+    consisting only of capital letters (headings) are skipped.
+
+    Args:
+        stdin: Input text stream
+        sections: Section marker lines and their directory names
+        canto_pattern: Pattern matching a canto header; group 1 is the roman number
+        canto_follows_section: Whether the canto header is the line right after
+                               each section marker (otherwise any line may be one)
+        keep_blank_lines: Whether to keep blank lines inside a canto
+        final_newline: Whether to end each non-empty canto file with a newline
+
+    Raises:
+        ValueError: If a section marker is not followed by a canto header
+                    (with canto_follows_section) or the number is invalid
+    """
+    dir = ""
+    no = 0
+    text_parts: List[str] = []
+
+    def write():
+        if dir:
+            text = "\n".join(text_parts).strip("\n")
+            if text and final_newline:
+                text += "\n"
+            with Path(dir, f"{no:02}.txt").open("w", buffering=1 << 17, encoding="utf-8") as file:
+                file.write(text)
+            text_parts.clear()
+
+    # Read the whole input at once; split on "\n" only, as readline() did
+    lines = iter(stdin.read().split("\n"))
+    for line in lines:
+        line = line.rstrip()
+        if section := sections.get(line):
+            write()
+            dir = section
+            Path(dir).mkdir(exist_ok=True)
+            if canto_follows_section:
+                line = next(lines, "").rstrip()
+                if not (m := canto_pattern.match(line)):
+                    raise ValueError(f"invalid line: {line}")
+                no = roman_number(m.group(1))
+        elif line.isascii() and line.isalpha() and line.isupper():
+            # Skip other all-caps headings (same as matching "[A-Z]+$")
+            pass
+        elif not canto_follows_section and (m := canto_pattern.match(line)):
+            write()
+            no = roman_number(m.group(1))
+        elif line.lstrip().startswith("*** END"):
+            write()
+            break
+        elif dir and (line or keep_blank_lines):
+            text_parts.append(line.lstrip())
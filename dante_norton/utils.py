@@ -2,7 +2,23 @@
 Utility functions for Dante Norton
 """
 
-import re
+
+def _to_roman(n: int) -> str:
+    """
+    Format a number (1-39) as a roman numeral using subtractive notation.
+
+    Args:
+        n: Number to format
+
+    Returns:
+        Roman numeral string (e.g., "XIV")
+    """
+    ones = ["", "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX"]
+    return "X" * (n // 10) + ones[n % 10]
+
+
+# Canto numbers only go up to 34 (Inferno), so a lookup table covers the domain
+_ROMAN = {_to_roman(i): i for i in range(1, 40)}
 
 
 def roman_number(r: str) -> int:
@@ -18,11 +34,7 @@ def roman_number(r: str) -> int:
     Raises:
         ValueError: If the input is not a valid roman numeral
     """
-    if m := re.match("(|X|XX|XXX)(|I(?=X$|V$))(X?)(V?)(|I|II|III)$", r.upper()):
-        x1 = len(m.group(1))
-        i1 = len(m.group(2))
-        x2 = len(m.group(3))
-        v1 = len(m.group(4))
-        i2 = len(m.group(5))
-        return x1 * 10 - i1 + x2 * 10 + v1 * 5 + i2
-    raise ValueError(f"invalid roman number: {r}")
+    v = _ROMAN.get(r.upper())
+    if v is None:
+        raise ValueError(f"invalid roman number: {r}")
+    return v
@@ -1,5 +1,5 @@
-import sys, os, re
-from dante_norton import roman_number
+import sys, re
+from dante_norton import split_cantos
 
 # Section markers and their directory names
 SECTIONS = {
@@ -8,31 +8,11 @@ SECTIONS = {
     "PARADISE": "paradiso",
 }
 
-dir = ""
-no = 0
-text = ""
+CANTO = re.compile(r"CANTO (\w+)\.$")
 
-def write():
-    global dir, no, text
-    if dir:
-        with open(f"{dir}/{no:02}.txt", "w") as file:
-            file.write(text.lstrip("\n").rstrip())
-        text = ""
+def main(stdin=sys.stdin):
+    split_cantos(stdin, SECTIONS, CANTO)
+    return 0
 
-while (line := sys.stdin.readline()):
-    line = line.rstrip()
-    if re.match("^[A-Z]+$", line) and line not in SECTIONS:
-        pass
-    elif line in SECTIONS:
-        write()
-        dir = SECTIONS[line]
-        if not os.path.exists(dir):
-            os.mkdir(dir)
-    elif m := re.match(r"CANTO (\w+)\.$", line):
-        write()
-        no = roman_number(m.group(1))
-    elif line.lstrip().startswith("*** END"):
-        write()
-        break
-    elif dir:
-        text += line.lstrip() + "\n"
+if __name__ == "__main__":
+    sys.exit(main())
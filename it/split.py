@@ -1,32 +1,21 @@
-import sys, os, re
-from dante_norton import roman_number
+import sys, re
+from dante_norton import split_cantos
 
-dir = ""
-no = 0
-text = ""
+# Section markers and their directory names
+SECTIONS = {
+    "Inferno": "inferno",
+    "Purgatorio": "purgatorio",
+    "Paradiso": "paradiso",
+}
 
-def write():
-    global dir, no, text
-    if dir:
-        with open(f"{dir}/{no:02}.txt", "w") as file:
-            file.write(text)
-        text = ""
+# Canto header on the line after each section marker
+CANTO = re.compile(r"Canto (\w+)")
 
-while (line := sys.stdin.readline()):
-    line = line.rstrip()
-    if re.match("[A-Z]+$", line):
-        pass
-    elif line in ["Inferno", "Purgatorio", "Paradiso"]:
-        write()
-        dir = line.lower()
-        if not os.path.exists(dir):
-            os.mkdir(dir)
-        line = sys.stdin.readline().rstrip()
-        if not (m:= re.match(r"Canto (\w+)", line)):
-            raise ValueError(f"invalid line: {line}")
-        no = roman_number(m.group(1))
-    elif line.lstrip().startswith("*** END"):
-        write()
-        break
-    elif line and dir:
-        text += line.lstrip() + "\n"
+def main(stdin=sys.stdin):
+    # Only verse lines are kept, one per line
+    split_cantos(stdin, SECTIONS, CANTO, canto_follows_section=True,
+                 keep_blank_lines=False, final_newline=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,61 @@
 Italian tokenizer for Dante's Divine Comedy.
 See analysis.md for tokenization rules and examples.
 """
+import re
 import sys
-from typing import List
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterator, List
 from pathlib import Path
 
+def _alpha_ranges() -> str:
+    """
+    Build the contents of a regex character class matching any character
+    for which str.isalpha() is true.
+
+    All code points are decoded into one string and scanned for runs of word
+    characters other than digits and underscore. These cover every letter but
+    also some numeric characters (e.g., "²", "½"), so only runs containing
+    those are checked per character.
+
+    Returns:
+        Character ranges to be placed inside "[...]" or "[^...]".
+    """
+    encoding = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+    text = array("I", range(0x110000)).tobytes().decode(encoding, "surrogatepass")
+    ranges = []
+    for m in re.finditer(r"[^\W\d_]+", text):
+        start, end = m.span()
+        if text[start:end].isalpha():
+            ranges.append(f"{re.escape(text[start])}-{re.escape(text[end - 1])}")
+            continue
+        # Split the run around the numeric characters
+        run_start = None
+        for i in range(start, end + 1):
+            if i < end and text[i].isalpha():
+                if run_start is None:
+                    run_start = i
+            elif run_start is not None:
+                ranges.append(f"{re.escape(text[run_start])}-{re.escape(text[i - 1])}")
+                run_start = None
+    return "".join(ranges)
+
+_ALPHA = _alpha_ranges()
+_ALPHA_RE = re.compile(f"[{_ALPHA}]")
+
+# One token per match, equivalent to split_on_apostrophes + tokenize_part:
+# - letters with optional apostrophes on both sides (e.g., "l'", "'nferno", "i'")
+# - an apostrophe not attached to letters
+# - any other single character
+_TOK = re.compile(f"'?[{_ALPHA}]+'?|'|[^{_ALPHA}']")
+
+# Only the first alternative of _TOK; it matches at the same positions, so
+# scanning with it yields exactly the tokens that contain alphabetic characters
+_WORD = re.compile(f"'?[{_ALPHA}]+'?")
+
+# Use the character-by-character implementation instead of _TOK
+USE_LEGACY_TOKENIZER = False
+
 def split_on_apostrophes(text: str) -> List[str]:
     """
     Split text on apostrophes based on context.
@@ -29,29 +80,27 @@ def split_on_apostrophes(text: str) -> List[str]:
         return []
 
     parts = []
-    s = ""  # Current segment being built
+    start = 0  # Start index of the current segment
     prev_is_alpha = False
 
     # Process each character in the text
-    for ch in text:
+    for i, ch in enumerate(text):
         if ch == "'":
             if prev_is_alpha:
                 # Alpha before apostrophe: split after apostrophe (e.g., "l'")
-                parts.append(s + ch)
-                s = ""
+                parts.append(text[start:i + 1])
+                start = i + 1
             else:
                 # Non-alpha before apostrophe: split before apostrophe (e.g., "'nferno")
-                if s:
-                    parts.append(s)
-                s = ch
-        else:
-            s += ch
+                if start < i:
+                    parts.append(text[start:i])
+                start = i
         # Track whether current character is alphabetic for next iteration
         prev_is_alpha = ch.isalpha()
     
     # Append any remaining segment
-    if s:
-        parts.append(s)
+    if start < len(text):
+        parts.append(text[start:])
 
     return parts
 
@@ -66,50 +115,95 @@ def tokenize_part(text: str) -> List[str]:
         List of tokens.
     """
     tokens = []
-    s = ""  # Current token being built
+    start = 0  # Start index of the current token
     prev_is_alpha = False
 
     # Process each character to separate alphabetic from non-alphabetic tokens
-    for ch in text:
+    for i, ch in enumerate(text):
         if ch.isalpha() or ch == "'":
             # Start new token if transitioning from non-alpha to alpha
-            if not prev_is_alpha and s:
-                tokens.append(s)
-                s = ""
-            s += ch
+            if not prev_is_alpha and start < i:
+                tokens.append(text[start:i])
+                start = i
             prev_is_alpha = True
         else:
-            # Save current alphabetic token before starting non-alpha token
-            if s:
-                tokens.append(s)
-            s = ch
+            # Save current token before starting a non-alpha token
+            if start < i:
+                tokens.append(text[start:i])
+            start = i
             prev_is_alpha = False
     
     # Append the final token
-    if s:
-        tokens.append(s)
+    if start < len(text):
+        tokens.append(text[start:])
 
     return tokens
 
-def tokenize(text: str) -> List[str]:
+def tokenize(text: str) -> Iterator[str]:
     """
-    Tokenize Italian text into a list of tokens.
+    Tokenize Italian text, yielding tokens one at a time.
 
     Args:
         text: Input text to tokenize.
 
-    Returns:
-        List of tokens. Concatenating all tokens should reconstruct the original text.
+    Yields:
+        Tokens. Concatenating all tokens should reconstruct the original text.
     """
-    tokens = []
+    if not USE_LEGACY_TOKENIZER:
+        for m in _TOK.finditer(text):
+            yield m.group()
+        return
+
     # First split on apostrophes, then tokenize each part
-    parts = split_on_apostrophes(text)
-    for part in parts:
-        tokens += tokenize_part(part)
-    return tokens
+    for part in split_on_apostrophes(text):
+        yield from tokenize_part(part)
 
-convert_dict = {}
+def tokenize_words(text: str) -> List[str]:
+    """
+    Tokenize Italian text, keeping only tokens with alphabetic characters.
 
+    Equivalent to filtering tokenize() with has_alpha(), but done in a
+    single regex scan without producing the other tokens.
+
+    Args:
+        text: Input text to tokenize.
+
+    Returns:
+        List of tokens containing alphabetic characters.
+    """
+    if not USE_LEGACY_TOKENIZER:
+        return _WORD.findall(text)
+    return [token for token in tokenize(text) if has_alpha(token)]
+
+def _build_convert_dict() -> Dict[str, str]:
+    """
+    Build the conversion dictionary from the pre-analyzed quote cases.
+
+    Returns:
+        Dictionary mapping original lines to their converted text.
+    """
+    script_dir = Path(__file__).parent
+    # Load original lines with U+2018/U+2019
+    quote_cases = [
+        line.rstrip()
+        for line in (script_dir / "quote_cases.txt").read_text(encoding="utf-8").splitlines()
+    ]
+    # Load LLM-converted lines where closing quotes are marked as "
+    quote_cases_converted = [
+        line.rstrip()
+        for line in (script_dir / "quote_cases_converted.txt").read_text(encoding="utf-8").splitlines()
+    ]
+    # Keep the original character where the converted text has a quotation
+    # mark ("), otherwise use the converted character (apostrophe -> ')
+    # Both files must align line by line and character by character
+    return {
+        x: "".join(xc if yc == '"' else yc for xc, yc in zip(x, y, strict=True))
+        for x, y in zip(quote_cases, quote_cases_converted, strict=True)
+    }
+
+convert_dict = _build_convert_dict()
+
+@lru_cache(maxsize=None)
 def convert_apostrophe(text: str) -> str:
     """
     Convert quotation marks in text based on pre-analyzed cases.
@@ -135,41 +229,47 @@ def convert_apostrophe(text: str) -> str:
         Output: "Com' io voleva dicer \u2018Tu m'appaghe\u2019,"
                 (elision Com' and m' use single quotes ('), quotation marks 'Tu...appaghe' remain U+2018/U+2019)
     """
-    # Lazy initialization of conversion dictionary
-    if not convert_dict:
-        script_dir = Path(__file__).parent
-        # Load original lines with U+2018/U+2019
-        with open(script_dir / "quote_cases.txt", "r", encoding="utf-8") as f:
-            quote_cases = [line.rstrip() for line in f]
-        # Load LLM-converted lines where closing quotes are marked as "
-        with open(script_dir / "quote_cases_converted.txt", "r", encoding="utf-8") as f:
-            quote_cases_converted = [line.rstrip() for line in f]
-        # Build conversion dictionary
-        for i in range(len(quote_cases)):
-            x = quote_cases[i]  # Original text
-            y = quote_cases_converted[i]  # LLM-converted text
-            z = ""
-            for j in range(len(x)):
-                if y[j] == '"':
-                    # Keep original character (quotation mark)
-                    z += x[j]
-                else:
-                    # Use converted character (apostrophe -> ')
-                    z += y[j]
-            convert_dict[x] = z
-
-    # Apply conversion if available
-    if converted := convert_dict.get(text):
-        return converted
-
-    # Default: replace U+2019 with apostrophe
-    return text.replace("\u2019", "'")
+    # Most lines have no U+2019 and are not in the pre-analyzed cases
+    if "\u2019" not in text:
+        return text
+
+    # Apply conversion if available, otherwise replace U+2019 with apostrophe
+    return convert_dict.get(text) or text.replace("\u2019", "'")
 
 def has_alpha(text):
     """
     Check if the text contains any alphabetic characters.
     """
-    return any(c.isalpha() for c in text)
+    return _ALPHA_RE.search(text) is not None
+
+def _process(filename: str, it_dir: Path, script_dir: Path) -> None:
+    """
+    Tokenize one canto file and write its tokenized output.
+
+    Args:
+        filename: Canto path without extension (e.g., "inferno/01").
+        it_dir: Directory containing the Italian text files.
+        script_dir: Directory to write the tokenized files to.
+    """
+    txt = filename + ".txt"
+    it_txt = it_dir / txt
+    out_txt = script_dir / txt
+    out_dir = out_txt.parent
+
+    # Read and strip lines from input text
+    canto = [
+        convert_apostrophe(l)
+        for line in it_txt.read_text(encoding="utf-8").splitlines()
+        if (l := line.strip())
+    ]
+
+    # Create output directory for this cantica
+    out_dir.mkdir(exist_ok=True)
+
+    with open(out_txt, "w", encoding="utf-8") as f:
+        for line in canto:
+            # Write the line and its alphabetic tokens, pipe-separated
+            print(line, *tokenize_words(line), sep="|", file=f)
 
 def main():
     """
@@ -185,38 +285,24 @@ def main():
         tokenize/paradiso/{01..33}.txt
 
     Each line in output contains tokens separated by '|'.
+    Files are processed in parallel worker processes.
     """
     import argparse
+    from itertools import repeat
+    from concurrent.futures import ProcessPoolExecutor
     parser = argparse.ArgumentParser()
     parser.add_argument("filenames", nargs="+", help="file paths")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
     args = parser.parse_args()
 
-    # Process each cantica and canto
+    # Process each cantica and canto; files are independent of each other
     script_dir = Path(__file__).resolve().parent
     it_dir = script_dir.parent / "it"
-    for filename in args.filenames:
-        txt = filename + ".txt"
-        it_txt = it_dir / txt
-        out_txt = script_dir / txt
-        out_dir = out_txt.parent
-
-        # Read and strip lines from input text
-        canto = [
-            convert_apostrophe(l)
-            for line in it_txt.read_text(encoding="utf-8").splitlines()
-            if (l := line.strip())
-        ]
-
-        # Create output directory for this cantica
-        out_dir.mkdir(exist_ok=True)
-
-        with open(out_txt, "w", encoding="utf-8") as f:
-            for line in canto:
-                # Tokenize and filter to only alphabetic tokens
-                tokens = [token for token in tokenize(line) if has_alpha(token)]
-                # Write pipe-separated tokens
-                print(line, *tokens, sep="|", file=f)
-        print(f"Wrote: {filename}")
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        results = executor.map(_process, args.filenames, repeat(it_dir), repeat(script_dir))
+        for filename, _ in zip(args.filenames, results):
+            print(f"Wrote: {filename}")
     return 0
 
 if __name__ == "__main__":